@@ -1,9 +1,56 @@
-from .server import Connect, Close, Auth, Ping, Select, Sel, Info, Monitor, DbSize, FlushDb, FlushAll, DropDb, Size, UserAdd, UserDel, Passwd, Users, WhoAmI, Save, BgSave, BgRewriteAof, Command, Commands
-from .strings import Get, Set, Incr, Decr, IncrBy, DecrBy, MGet, MSet, StrLen
-from .keys import Del, Delete, Exists, Keys, Rename, Type, Expire, Ttl, Persist
-from .lists import LPush, RPush, LPop, RPop, LRange, LLen, LIndex, LGet
-from .sets import SAdd, SRem, SMembers, SIsMember, SCard, SDiff, SInter, SUnion, SRandMember
-from .hashes import HSet, HGet, HDel, HGetAll, HIncrBy, HExists, HLen, HKeys, HVals, HMSet, HMGet, HDelAll, HExpire
-from .zsets import ZAdd, ZRem, ZScore, ZCard, ZRange, ZRevRange, ZGet
-from .pubsub import Publish, Pub, Subscribe, Sub, Unsubscribe, Unsub, PSubscribe, PSub, PUnsubscribe, PUnsub
-from .transactions import Multi, Exec, Discard, Watch, Unwatch
\ No newline at end of file
+import importlib
+
+"""
+goredis public API.
+
+Submodules are imported lazily (PEP 562): the first access to a name
+imports just the module that provides it, so `import goredis` no longer
+pays for every command module when the caller only needs a few.
+"""
+_MODULE_EXPORTS = {
+    'client': ('Pipeline', 'Pool', 'ArrayReply', 'Raw', 'set_codec'),
+    'aio': ('AsyncGoRedisClient',),
+    'server': ('Connect', 'Close', 'Auth', 'Ping', 'Select', 'Sel', 'Info',
+               'Monitor', 'DbSize', 'FlushDb', 'FlushAll', 'DropDb', 'Size',
+               'UserAdd', 'UserDel', 'Passwd', 'Users', 'WhoAmI', 'Save',
+               'BgSave', 'BgRewriteAof', 'Command', 'Commands'),
+    'strings': ('Get', 'Set', 'Incr', 'Decr', 'IncrBy', 'DecrBy', 'MGet',
+                'MSet', 'StrLen'),
+    'keys': ('Del', 'Delete', 'Exists', 'Keys', 'Rename', 'Type', 'Expire',
+             'Ttl', 'Persist'),
+    'lists': ('LPush', 'RPush', 'LPop', 'RPop', 'LRange', 'LLen', 'LIndex',
+              'LGet'),
+    'sets': ('SAdd', 'SRem', 'SMembers', 'SIsMember', 'SCard', 'SDiff',
+             'SInter', 'SUnion', 'SRandMember'),
+    'hashes': ('HSet', 'HGet', 'HDel', 'HGetAll', 'HIncrBy', 'HExists',
+               'HLen', 'HKeys', 'HVals', 'HMSet', 'HMGet', 'HDelAll',
+               'HExpire'),
+    'zsets': ('ZAdd', 'ZAddMany', 'ZRem', 'ZScore', 'ZCard', 'ZRange',
+              'ZRevRange', 'ZGet', 'ZPipeline', 'Sync'),
+    'pubsub': ('Publish', 'Pub', 'Subscribe', 'Sub', 'Unsubscribe', 'Unsub',
+               'PSubscribe', 'PSub', 'PUnsubscribe', 'PUnsub'),
+    'transactions': ('Multi', 'Exec', 'Discard', 'Watch', 'Unwatch',
+                     'Transaction'),
+}
+
+_NAME_TO_MODULE = {
+    name: module
+    for module, names in _MODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+def __getattr__(name):
+    """Import the submodule providing name on first access (PEP 562)."""
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache on the package so subsequent lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+
+from .client import _encode_parts
+
+"""
+GoRedis Async Python Client
+
+asyncio variant of the client for cooperative concurrency. Many
+coroutines can share one connection: writes go out immediately and a
+single background reader task resolves the pending replies in FIFO
+order, so concurrent commands pipeline naturally instead of each one
+paying a full round-trip.
+"""
+class AsyncGoRedisClient:
+    """
+    Internal class handling RESP over an asyncio stream pair.
+
+    Create instances with the connect() classmethod.
+    """
+    def __init__(self, reader, writer):
+        """
+        Wrap an established (reader, writer) stream pair.
+
+        Args:
+            reader (asyncio.StreamReader): Stream to parse replies from.
+            writer (asyncio.StreamWriter): Stream to write frames to.
+        """
+        self.reader = reader
+        self.writer = writer
+        self._pending = deque()
+        self._reader_task = asyncio.get_event_loop().create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=7379):
+        """Open a connection and return a ready AsyncGoRedisClient."""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send_command(self, *args):
+        """
+        Send a command and its arguments to the server using RESP.
+
+        Returns the parsed response. Safe to call from many coroutines
+        concurrently; replies are matched to callers in send order.
+        """
+        fut = asyncio.get_event_loop().create_future()
+        # No await between registering the future and writing the frame,
+        # so the pending queue always matches the wire order.
+        self._pending.append(fut)
+        self.writer.write(b"".join(_encode_parts(args)))
+        await self.writer.drain()
+        return await fut
+
+    def pipeline(self):
+        """Return an AsyncPipeline that batches commands into one write."""
+        return AsyncPipeline(self)
+
+    async def _read_loop(self):
+        """Parse replies off the stream and resolve pending futures in order."""
+        while True:
+            try:
+                reply = await self._read_response()
+            except asyncio.CancelledError:
+                return
+            except (asyncio.IncompleteReadError, EOFError, OSError) as e:
+                exc = EOFError("Connection closed by server")
+                while self._pending:
+                    fut = self._pending.popleft()
+                    if not fut.done():
+                        fut.set_exception(exc)
+                return
+            except Exception as e:
+                # Server error reply: fail this request, keep the connection.
+                fut = self._pending.popleft()
+                if not fut.done():
+                    fut.set_exception(e)
+                continue
+            fut = self._pending.popleft()
+            if not fut.done():
+                fut.set_result(reply)
+
+    async def _read_response(self):
+        """
+        Read and parse a RESP response from the stream.
+
+        Handles Simple Strings, Errors, Integers, Bulk Strings, and Arrays.
+        """
+        line = await self.reader.readuntil(b'\r\n')
+        prefix = line[0:1]
+        payload = line[1:-2]
+
+        if prefix == b'+': return payload.decode('utf-8')
+        if prefix == b'-': raise Exception(f"Server Error: {payload.decode('utf-8')}")
+        if prefix == b':': return int(payload)
+        if prefix == b'$':
+            length = int(payload)
+            if length == -1: return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2].decode('utf-8')
+        if prefix == b'*':
+            count = int(payload)
+            if count == -1: return None
+            return [await self._read_response() for _ in range(count)]
+        raise Exception(f"Unknown RESP type received: {prefix}")
+
+    async def close(self):
+        """Stop the reader task and close the connection."""
+        self._reader_task.cancel()
+        self.writer.close()
+        await self.writer.wait_closed()
+
+class AsyncPipeline:
+    """
+    Batches multiple commands into a single write on an async client.
+
+    Commands are queued with queue_command(); execute() writes the whole
+    buffer once, drains, and awaits all the replies in order.
+    """
+    def __init__(self, client):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client (AsyncGoRedisClient): Connection to batch commands on.
+        """
+        self.client = client
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def queue_command(self, *args):
+        """Queue a command into the pipeline buffer without sending it."""
+        for part in _encode_parts(args):
+            self.buffer += part
+        self.pending += 1
+        return self
+
+    async def execute(self):
+        """
+        Send all queued commands in one write and return their replies in order.
+        """
+        if self.pending == 0:
+            return []
+        loop = asyncio.get_event_loop()
+        futs = [loop.create_future() for _ in range(self.pending)]
+        self.client._pending.extend(futs)
+        self.client.writer.write(bytes(self.buffer))
+        self.buffer.clear()
+        self.pending = 0
+        await self.client.writer.drain()
+        return [await f for f in futs]
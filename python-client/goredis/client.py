@@ -1,5 +1,22 @@
+import os
 import socket
 import io
+import queue
+import threading
+from concurrent.futures import Future
+
+try:
+    import hiredis
+except ImportError:
+    hiredis = None
+
+# Largest iovec the kernel accepts in one sendmsg() call (UIO_MAXIOV).
+_IOV_MAX = 1024
+
+# Frames up to this size are coalesced into a reusable per-thread
+# scratch buffer instead of allocating a fresh frame per command.
+_SCRATCH_MAX = 4096
+_scratch = threading.local()
 
 """
 GoRedis Python Client
@@ -8,6 +25,135 @@ This module provides a simple client to interact with a Go-Redis server
 using the RESP protocol. It includes basic commands for connecting,
 authenticating, and performing common Redis operations.
 """
+class Raw(bytes):
+    """
+    Marker for pre-encoded argument payloads.
+
+    A Raw value is framed exactly as passed -- no str() round-trip, no
+    copy, no type dispatch beyond the first isinstance check -- for
+    performance-critical callers shipping large pre-serialized bytes.
+    Plain bytes/bytearray/memoryview arguments are framed as-is too;
+    Raw just makes the intent explicit at the call site.
+    """
+    __slots__ = ()
+
+def _to_bulk(arg):
+    """
+    Convert one command argument to its bulk-string payload bytes.
+
+    bytes, bytearray and memoryview payloads are framed without a copy.
+    Integers use the C-level b"%d" formatter instead of round-tripping
+    through str().encode(), since RESP bulk payloads are plain ASCII.
+    """
+    if isinstance(arg, (bytes, bytearray, memoryview)):
+        return arg
+    if isinstance(arg, str):
+        return arg.encode('utf-8')
+    if isinstance(arg, int):
+        return b"%d" % arg
+    return str(arg).encode('utf-8')
+
+class ArrayReply:
+    """
+    Lazy view over an array reply.
+
+    Holds the elements as received off the wire (bulk strings stay raw
+    bytes) and decodes on access, so callers that only need len() or
+    the first few elements never pay for decoding the rest. Decoding
+    follows the client's decode_responses setting: with it off,
+    elements come back as raw bytes. Obtained by passing lazy=True to
+    helpers like LRange or HGetAll.
+    """
+    __slots__ = ('_raw', '_decode')
+
+    def __init__(self, raw, decode=True):
+        self._raw = raw
+        self._decode = decode
+
+    def _wrap(self, value):
+        if isinstance(value, bytes):
+            return value.decode('utf-8') if self._decode else value
+        if isinstance(value, list):
+            return ArrayReply(value, self._decode)
+        return value
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._wrap(v) for v in self._raw[i]]
+        return self._wrap(self._raw[i])
+
+    def __iter__(self):
+        for value in self._raw:
+            yield self._wrap(value)
+
+    def __repr__(self):
+        return f"ArrayReply({len(self._raw)} elements)"
+
+    def raw(self):
+        """Return the underlying list of undecoded elements."""
+        return self._raw
+
+class _IoUringTransport:
+    """
+    sendall/recv over an io_uring submission queue (Linux, liburing).
+
+    Exposes the small slice of the socket API the client uses so the
+    rest of the code stays backend-agnostic. Each operation is one SQE
+    submitted and waited with a single io_uring_submit_and_wait call
+    instead of a send/recv syscall pair per command.
+    """
+    def __init__(self, sock, entries=64):
+        """
+        Set up a ring over an already-connected socket.
+
+        Raises ImportError when the liburing bindings are missing, so
+        callers can fall back to plain socket I/O.
+        """
+        import liburing
+        self._liburing = liburing
+        self._fd = sock.fileno()
+        self._ring = liburing.io_uring()
+        liburing.io_uring_queue_init(entries, self._ring, 0)
+        self._cqe = liburing.io_uring_cqe()
+        self._rbuf = bytearray(65536)
+
+    def _submit_and_wait(self):
+        """Submit queued SQEs and block for one completion; return its result."""
+        liburing = self._liburing
+        liburing.io_uring_submit_and_wait(self._ring, 1)
+        liburing.io_uring_wait_cqe(self._ring, self._cqe)
+        res = liburing.trap_error(self._cqe.res)
+        liburing.io_uring_cqe_seen(self._ring, self._cqe)
+        return res
+
+    def sendall(self, data):
+        """Write the whole buffer through SEND SQEs."""
+        liburing = self._liburing
+        view = memoryview(data)
+        while len(view):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_send(sqe, self._fd, view, len(view), 0)
+            sent = self._submit_and_wait()
+            view = view[sent:]
+
+    def recv(self, n):
+        """Read up to n bytes through a RECV SQE."""
+        liburing = self._liburing
+        buf = self._rbuf
+        if n > len(buf):
+            buf = self._rbuf = bytearray(n)
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_recv(sqe, self._fd, buf, n, 0)
+        got = self._submit_and_wait()
+        return bytes(buf[:got])
+
+    def close(self):
+        """Tear down the ring."""
+        self._liburing.io_uring_queue_exit(self._ring)
+
 class GoRedisClient:
     """
     Internal class to handle RESP protocol and socket communication.
@@ -16,72 +162,680 @@ class GoRedisClient:
     implements the Redis Serialization Protocol (RESP) for sending
     commands and parsing responses.
     """
-    def __init__(self, host, port):
+    def __init__(self, host, port, decode_responses=True, io_backend='socket'):
         """
         Initialize the socket connection.
-        
+
         Args:
             host (str): The server hostname or IP address.
             port (int): The port number the server is listening on.
+            decode_responses (bool): When False, bulk and simple string
+                replies are returned as raw bytes instead of being
+                UTF-8 decoded -- required for binary-safe values and
+                cheaper for large payloads.
+            io_backend (str): 'socket' (default) or 'iouring' to route
+                reads/writes through an io_uring submission queue when
+                the liburing bindings are available (Linux only; falls
+                back to the stdlib socket otherwise).
         """
+        self.host = host
+        self.port = port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.sock.connect((host, port))
-        self.file = self.sock.makefile('rb')
+        # Small RESP frames must not sit in Nagle's buffer for up to 40 ms,
+        # and 1 MiB kernel buffers let pipelined replies arrive in few recvs.
+        # Keepalive detects silently dropped long-lived connections.
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Receive buffer for the RESP scanner: bytes are pulled from the
+        # socket in large chunks and parsed in place from _rpos onwards.
+        self._rbuf = bytearray()
+        self._rpos = 0
+        # Response parser backend: the hiredis C extension when installed,
+        # the pure-Python scanner otherwise. GOREDIS_PARSER=python|hiredis
+        # overrides the automatic choice.
+        self.decode_responses = decode_responses
+        backend = os.environ.get('GOREDIS_PARSER', 'hiredis')
+        if backend == 'hiredis' and hiredis is not None:
+            if decode_responses:
+                self._hiredis = hiredis.Reader(encoding='utf-8')
+            else:
+                self._hiredis = hiredis.Reader()
+        else:
+            self._hiredis = None
+        # Replies deferred by send_noreply() and collected by drain_replies().
+        self._pending_noreply = 0
+        # I/O transport: the socket itself, or an io_uring wrapper that
+        # exposes the same sendall/recv surface.
+        self._io = self.sock
+        if io_backend == 'iouring':
+            try:
+                self._io = _IoUringTransport(self.sock)
+            except (ImportError, OSError):
+                pass
+
+    def _encode_command(self, *args):
+        """
+        Encode a command and its arguments into a RESP frame (bytes).
+        """
+        return b"".join(_encode_parts(args))
 
-    def send_command(self, *args):
+    def _sendall_iov(self, parts):
+        """
+        Write a list of frame fragments to the socket without joining them.
+
+        sendmsg() hands the fragment list to the kernel as an iovec, so
+        large argument payloads are never copied into one contiguous
+        buffer. Falls back to sendall(join) where sendmsg is unavailable.
+        """
+        if self._io is not self.sock or not hasattr(self.sock, 'sendmsg'):
+            self._io.sendall(b"".join(parts))
+            return
+        i = 0
+        n = len(parts)
+        while i < n:
+            sent = self.sock.sendmsg(parts[i:i + _IOV_MAX])
+            while i < n and sent >= len(parts[i]):
+                sent -= len(parts[i])
+                i += 1
+            if sent and i < n:
+                parts[i] = memoryview(parts[i])[sent:]
+
+    def send_command(self, *args, lazy=False):
         """
         Send a command and its arguments to the server using RESP.
-        
-        Returns the parsed response from the server.
+
+        Returns the parsed response from the server. With lazy=True an
+        array reply is returned as an ArrayReply view whose elements
+        are decoded on access instead of eagerly.
         """
-        # RESP requires length in BYTES, not characters.
-        cmd = f"*{len(args)}\r\n".encode('utf-8')
-        for arg in args:
-            b_arg = str(arg).encode('utf-8')
-            cmd += f"${len(b_arg)}\r\n".encode('utf-8')
-            cmd += b_arg + b"\r\n"
+        parts = _encode_parts(args)
+        if sum(map(len, parts)) <= _SCRATCH_MAX:
+            # Small frames: coalesce into a reusable thread-local
+            # scratch buffer and send with one call, so the hot path
+            # allocates no per-command frame object. Large frames keep
+            # the iovec path, which never copies the payload at all.
+            buf = getattr(_scratch, 'buf', None)
+            if buf is None:
+                buf = _scratch.buf = bytearray(_SCRATCH_MAX)
+            del buf[:]
+            for p in parts:
+                buf += p
+            self._io.sendall(memoryview(buf))
+        else:
+            self._sendall_iov(parts)
+        return self._read_response(lazy)
 
-        self.sock.sendall(cmd)
+    def send_raw(self, frame):
+        """
+        Send a pre-encoded RESP frame and return the parsed response.
+
+        Used by helpers whose frame is fully known at import time (PING,
+        DBSIZE, MULTI, ...) to skip the per-call encode loop.
+        """
+        self._io.sendall(frame)
         return self._read_response()
 
-    def _read_response(self):
+    def send_noreply(self, *args):
+        """
+        Send a command without waiting for its reply (fire-and-forget).
+
+        The server's reply stays queued on the connection; call
+        drain_replies() at a sync point before issuing any normal
+        command, or the streams fall out of step.
+        """
+        self._sendall_iov(_encode_parts(args))
+        self._pending_noreply += 1
+
+    def drain_replies(self):
+        """Read and return all replies deferred by send_noreply(), in order."""
+        replies = [self._read_response() for _ in range(self._pending_noreply)]
+        self._pending_noreply = 0
+        return replies
+
+    def pipeline(self):
+        """Return a Pipeline that batches commands into a single round-trip."""
+        return Pipeline(self)
+
+    def _fill_buffer(self):
+        """Pull one chunk from the socket into the receive buffer."""
+        chunk = self._io.recv(65536)
+        if not chunk:
+            raise EOFError("Connection closed by server")
+        self._rbuf += chunk
+
+    def _compact_buffer(self):
+        """Drop consumed bytes once the read position grows past 1 MiB."""
+        if self._rpos > 1048576:
+            del self._rbuf[:self._rpos]
+            self._rpos = 0
+
+    def _next_line_end(self):
+        """Ensure a full CRLF-terminated line is buffered; return the CRLF index."""
+        while True:
+            end = self._rbuf.find(b'\r\n', self._rpos)
+            if end >= 0:
+                return end
+            self._fill_buffer()
+
+    def _read_exact(self, n):
+        """Return exactly n bytes from the receive buffer."""
+        while len(self._rbuf) - self._rpos < n:
+            self._fill_buffer()
+        data = bytes(self._rbuf[self._rpos:self._rpos + n])
+        self._rpos += n
+        self._compact_buffer()
+        return data
+
+    def _read_response(self, lazy=False):
         """
         Read and parse a RESP response from the server.
-        
+
+        Dispatches to the hiredis C parser when available, falling back
+        to the pure-Python scanner. With lazy=True an array reply is
+        wrapped in an ArrayReply (hiredis decodes eagerly regardless,
+        so laziness only saves work on the Python parser).
+        """
+        if self._hiredis is not None:
+            reply = self._read_response_hiredis()
+            if lazy and isinstance(reply, list):
+                return ArrayReply(reply, self.decode_responses)
+            return reply
+        return self._read_response_py(lazy)
+
+    def _read_response_hiredis(self):
+        """Parse one reply with the hiredis Reader, feeding it recv chunks."""
+        while True:
+            reply = self._hiredis.gets()
+            if reply is not False:
+                if isinstance(reply, hiredis.ReplyError):
+                    raise Exception(f"Server Error: {reply}")
+                return reply
+            chunk = self._io.recv(65536)
+            if not chunk:
+                raise EOFError("Connection closed by server")
+            self._hiredis.feed(chunk)
+
+    def _read_response_py(self, lazy=False):
+        """
+        Read and parse a RESP response with the pure-Python scanner.
+
         Handles Simple Strings, Errors, Integers, Bulk Strings, and Arrays.
+        Parses directly out of the receive buffer so a large array reply
+        costs a couple of recv() calls rather than one buffered read per
+        element.
         """
-        line = self.file.readline()
-        if not line:
-            raise EOFError("Connection closed by server")
+        # Array replies are handled with an explicit stack of
+        # [remaining_count, elements] frames rather than one recursive
+        # call per element, which costs a Python frame each and risks
+        # RecursionError on huge replies.
+        stack = []
+        while True:
+            end = self._next_line_end()
+            buf = self._rbuf
+            pos = self._rpos
+            prefix = buf[pos]
+
+            if prefix == 43:  # b'+'
+                value = bytes(buf[pos + 1:end])
+                if self.decode_responses:
+                    value = value.decode('utf-8')
+                self._rpos = end + 2
+            elif prefix == 45:  # b'-'
+                message = bytes(buf[pos + 1:end]).decode('utf-8')
+                self._rpos = end + 2
+                self._compact_buffer()
+                raise Exception(f"Server Error: {message}")
+            elif prefix == 58:  # b':'
+                value, self._rpos = _parse_int(buf, pos + 1)
+            elif prefix == 36:  # b'$'
+                length, self._rpos = _parse_int(buf, pos + 1)
+                if length == -1:
+                    value = None
+                else:
+                    value = self._read_exact(length)
+                    self._read_exact(2)
+                    if self.decode_responses and not lazy:
+                        value = value.decode('utf-8')
+            elif prefix == 42:  # b'*'
+                count, self._rpos = _parse_int(buf, pos + 1)
+                if count == -1:
+                    value = None
+                elif count == 0:
+                    value = []
+                else:
+                    stack.append([count, []])
+                    continue
+            else:
+                raise Exception(f"Unknown RESP type received: {bytes(buf[pos:pos + 1])}")
+            self._compact_buffer()
 
-        line = line.rstrip(b'\r\n')
-        prefix = line[0:1]
-        payload = line[1:]
-
-        if prefix == b'+': return payload.decode('utf-8')
-        if prefix == b'-': raise Exception(f"Server Error: {payload.decode('utf-8')}")
-        if prefix == b':': return int(payload)
-        if prefix == b'$':
-            length = int(payload)
-            if length == -1: return None
-            data = self.file.read(length)
-            self.file.read(2)
-            return data.decode('utf-8')
-        if prefix == b'*':
-            count = int(payload)
-            if count == -1: return None
-            return [self._read_response() for _ in range(count)]
-        raise Exception(f"Unknown RESP type received: {prefix}")
+            # Attach the parsed value to the innermost open array, closing
+            # filled arrays into their parents until one stays open.
+            while stack:
+                top = stack[-1]
+                top[1].append(value)
+                top[0] -= 1
+                if top[0]:
+                    break
+                value = stack.pop()[1]
+            else:
+                if lazy and isinstance(value, list):
+                    return ArrayReply(value, self.decode_responses)
+                return value
 
     def close(self):
         """Close the underlying socket connection."""
         self.sock.close()
 
+class Pipeline:
+    """
+    Batches multiple commands into a single network round-trip.
+
+    Commands are queued with queue_command() into one buffer; execute()
+    sends the whole buffer with a single sendall and then reads all the
+    replies in order. Usable as a context manager: the queued commands
+    are flushed on exit.
+    """
+    def __init__(self, client=None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            client (GoRedisClient): Connection to batch commands on.
+                Defaults to the global client.
+        """
+        self.client = client if client is not None else get_client()
+        if isinstance(self.client, MultiplexedClient):
+            # Same guard as MultiplexedClient.pipeline(): writing behind
+            # the writer thread would race the reader for the replies.
+            raise RuntimeError("Pipeline is not supported on a multiplexed "
+                               "client; concurrent sends are coalesced "
+                               "automatically.")
+        if isinstance(self.client, Pool):
+            raise RuntimeError("Pipeline needs a dedicated connection; "
+                               "check one out with pool.acquire() and use "
+                               "c.pipeline() on it.")
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def queue_command(self, *args):
+        """Queue a command into the pipeline buffer without sending it."""
+        self.buffer += self.client._encode_command(*args)
+        self.pending += 1
+        return self
+
+    def execute(self):
+        """
+        Send all queued commands in one write and return their replies in order.
+
+        Every queued reply is consumed even when some are errors, so the
+        connection stays in step; the first error is raised after the
+        batch is fully drained.
+        """
+        if self.pending == 0:
+            return []
+        first_error = None
+        try:
+            self.client._io.sendall(self.buffer)
+            replies = []
+            for _ in range(self.pending):
+                try:
+                    replies.append(self.client._read_response())
+                except (EOFError, OSError):
+                    # Connection is gone; nothing left to drain.
+                    raise
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
+                    replies.append(exc)
+        finally:
+            # Reset unconditionally: the commands were already sent, so a
+            # retrying execute() must not replay them.
+            self.buffer.clear()
+            self.pending = 0
+        if first_error is not None:
+            raise first_error
+        return replies
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+        return False
+
+"""
+Pre-encoded "$len\r\nNAME\r\n" bulk strings for command names, so the
+closed set of verbs is never re-encoded per call. Seeded with the
+commands the helper modules use and extended lazily for other names.
+"""
+_CMD_PREFIX = {
+    name: b"$%d\r\n%s\r\n" % (len(name), name.encode('utf-8'))
+    for name in (
+        "AUTH", "SELECT", "WATCH",
+        "GET", "SET", "INCR", "DECR", "INCRBY", "DECRBY", "MGET", "MSET", "STRLEN",
+        "DEL", "EXISTS", "KEYS", "RENAME", "TYPE", "EXPIRE", "TTL", "PERSIST",
+        "LPUSH", "RPUSH", "LPOP", "RPOP", "LRANGE", "LLEN", "LINDEX", "LGET",
+        "SADD", "SREM", "SMEMBERS", "SISMEMBER", "SCARD", "SDIFF", "SINTER",
+        "SUNION", "SRANDMEMBER",
+        "HSET", "HGET", "HDEL", "HGETALL", "HINCRBY", "HEXISTS", "HLEN", "HKEYS",
+        "HVALS", "HMSET", "HMGET", "HDELALL", "HEXPIRE",
+        "ZADD", "ZREM", "ZSCORE", "ZCARD", "ZRANGE", "ZREVRANGE", "ZGET",
+        "SETBIT", "GETBIT", "BITCOUNT", "BITOP", "BITPOS", "BITFIELD",
+        "GEOADD", "GEOPOS", "GEODIST", "GEOHASH", "GEORADIUS", "GEOSEARCH",
+        "GEOSEARCHSTORE",
+        "PFADD", "PFCOUNT", "PFDEBUG", "PFMERGE",
+        "PUBLISH", "SUBSCRIBE", "UNSUBSCRIBE", "PSUBSCRIBE", "PUNSUBSCRIBE",
+    )
+}
+
+def _fixed_frame(name):
+    """Pre-encode the full RESP frame for a zero-argument command."""
+    return b"*1\r\n$%d\r\n%s\r\n" % (len(name), name.encode('utf-8'))
+
+def _gen_encoder(name, arity):
+    """
+    Generate a specialized RESP encoder for a fixed-arity command.
+
+    The generated function inlines the frame header (array length plus
+    the command's bulk string) as one constant and converts each
+    argument with inline type checks, so hot wrappers like Get/Set skip
+    the generic encode loop, the *args tuple and the name lookup.
+    """
+    b_name = name.encode('utf-8')
+    header = b"*%d\r\n$%d\r\n%s\r\n" % (arity + 1, len(b_name), b_name)
+    params = ", ".join("a%d" % i for i in range(arity))
+    lines = ["def _enc(%s):" % params, "    parts = [%r]" % header]
+    for i in range(arity):
+        lines += [
+            "    b = a%d if isinstance(a%d, (bytes, bytearray, memoryview)) "
+            "else a%d.encode('utf-8') if isinstance(a%d, str) "
+            "else b'%%d' %% a%d if isinstance(a%d, int) "
+            "else str(a%d).encode('utf-8')" % ((i,) * 7),
+            "    parts += (b'$%d\\r\\n' % len(b), b, b'\\r\\n')",
+        ]
+    lines.append("    return b''.join(parts)")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_enc"]
+
+def _parse_int(buf, i):
+    """
+    Parse an ASCII integer from buf at index i, consuming the trailing CRLF.
+
+    Returns (value, index past the CRLF). Accumulates digits from the
+    byte values directly instead of slicing out the payload and handing
+    it to int(), saving an allocation per integer parsed.
+    """
+    neg = buf[i] == 45  # '-'
+    if neg:
+        i += 1
+    # First digit unrolled out of the loop: it needs no multiply, and
+    # single-digit values (most counts and small lengths) skip the loop
+    # entirely.
+    value = buf[i] - 48
+    i += 1
+    b = buf[i]
+    while b != 13:  # '\r'
+        value = value * 10 + (b - 48)
+        i += 1
+        b = buf[i]
+    return (-value if neg else value, i + 2)
+
+def _encode_parts(args):
+    """
+    Encode a command into a list of RESP frame fragments.
+
+    Shared by the sync client, Pipeline and the asyncio backend.
+    """
+    # RESP requires length in BYTES, not characters. Collect the frame
+    # fragments in a list instead of growing an immutable bytes object
+    # per fragment (O(N^2) copying for large commands).
+    parts = [b"*%d\r\n" % len(args)]
+    rest = iter(args)
+    if args and isinstance(args[0], str):
+        # Command names come from a small closed set; use (and extend)
+        # the pre-encoded bulk-string cache instead of re-encoding.
+        name = args[0]
+        prefix = _CMD_PREFIX.get(name)
+        if prefix is None:
+            b_name = name.encode('utf-8')
+            prefix = _CMD_PREFIX[name] = b"$%d\r\n%s\r\n" % (len(b_name), b_name)
+        parts.append(prefix)
+        next(rest)
+    for arg in rest:
+        b_arg = _to_bulk(arg)
+        parts += (b"$%d\r\n" % len(b_arg), b_arg, b"\r\n")
+    return parts
+
+class MultiplexedClient(GoRedisClient):
+    """
+    Thread-safe client that multiplexes callers over one socket.
+
+    Each call enqueues its RESP frame with a Future; a writer thread
+    drains the queue, coalescing everything waiting into one sendall
+    (implicit pipelining), while a reader thread parses replies off the
+    socket and resolves the Futures in FIFO order — RESP guarantees
+    replies come back in request order on a single connection.
+    """
+    def __init__(self, host, port, **kwargs):
+        """
+        Connect and start the writer/reader threads.
+
+        Args:
+            host (str): The server hostname or IP address.
+            port (int): The port number the server is listening on.
+            **kwargs: Forwarded to GoRedisClient (decode_responses, ...).
+        """
+        super().__init__(host, port, **kwargs)
+        self._write_q = queue.SimpleQueue()
+        self._inflight = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._writer.start()
+        self._reader.start()
+
+    def send_command(self, *args, lazy=False):
+        """
+        Send a command from any thread and block for its reply.
+
+        lazy is accepted for interface parity but ignored: the shared
+        reader thread always parses replies eagerly.
+        """
+        return self._submit(self._encode_command(*args))
+
+    def send_raw(self, frame):
+        """Send a pre-encoded frame from any thread and block for its reply."""
+        return self._submit(frame)
+
+    def _submit(self, frame):
+        """Queue one frame for the writer thread and wait for the reply."""
+        fut = Future()
+        self._write_q.put((frame, fut))
+        return fut.result()
+
+    def _write_loop(self):
+        """Drain the write queue, coalescing waiting frames into one send."""
+        q = self._write_q
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            buf = bytearray()
+            closing = False
+            while True:
+                frame, fut = item
+                # Register the future before the frame hits the wire so the
+                # reader always resolves replies in send order.
+                self._inflight.put(fut)
+                buf += frame
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+            try:
+                self._io.sendall(buf)
+            except OSError as e:
+                self._fail_pending(e)
+                return
+            if closing:
+                return
+
+    def _read_loop(self):
+        """Parse replies off the socket and resolve pending futures in order."""
+        while True:
+            try:
+                reply = self._read_response()
+            except (EOFError, OSError) as e:
+                self._fail_pending(e)
+                return
+            except Exception as e:
+                # Server error reply: fail this request, keep the connection.
+                self._inflight.get().set_exception(e)
+                continue
+            self._inflight.get().set_result(reply)
+
+    def _fail_pending(self, exc):
+        """Fail every not-yet-answered request with the given exception."""
+        while True:
+            try:
+                self._inflight.get_nowait().set_exception(exc)
+            except queue.Empty:
+                return
+
+    def pipeline(self):
+        """Explicit pipelines would bypass the writer thread; disallow them."""
+        raise RuntimeError("Pipeline is not supported on a multiplexed client; "
+                           "concurrent sends are coalesced automatically.")
+
+    def close(self):
+        """Stop the writer thread and close the socket."""
+        self._write_q.put(None)
+        self.sock.close()
+
+class _PooledConnection:
+    """Context manager returning its connection to the pool on exit."""
+    def __init__(self, pool, client):
+        self.pool = pool
+        self.client = client
+
+    def __enter__(self):
+        return self.client
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.pool.release(self.client)
+        return False
+
+class Pool:
+    """
+    Fixed-size pool of connections for thread-parallel users.
+
+    Connections are created lazily up to size; acquire() blocks once
+    they are all checked out. Long-running commands (SAVE, MONITOR)
+    then only occupy one connection instead of blocking everyone:
+
+        with pool.acquire() as c:
+            c.send_command("GET", "key")
+
+    For explicit pipelining, call c.pipeline() on an acquired
+    connection.
+    """
+    def __init__(self, host, port, size=4, **kwargs):
+        """
+        Set up a lazy pool of up to size connections.
+
+        Args:
+            host (str): The server hostname or IP address.
+            port (int): The port number the server is listening on.
+            size (int): Maximum number of connections to open.
+            **kwargs: Forwarded to GoRedisClient (decode_responses, ...).
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self._kwargs = kwargs
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Check a connection out of the pool.
+
+        Returns a context manager yielding a GoRedisClient; blocks when
+        all connections are in use.
+        """
+        try:
+            c = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    c = GoRedisClient(self.host, self.port, **self._kwargs)
+                    return _PooledConnection(self, c)
+            c = self._idle.get()
+        return _PooledConnection(self, c)
+
+    def release(self, client):
+        """Return a connection to the pool."""
+        self._idle.put(client)
+
+    def close(self):
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
 """
 Global client instance.
 """
 _global_client = None
 
+def _not_connected(*args):
+    """Placeholder send hook used while no connection is established."""
+    raise RuntimeError("Client not connected. Call Connect() first.")
+
+def _noreply_unsupported(*args):
+    """No-reply hook for connection modes that cannot defer replies."""
+    raise RuntimeError("reply=False requires a plain (non-pooled, "
+                       "non-multiplexed) connection.")
+
+"""
+Module-level send hooks. Connect() points these at the bound
+send_command/send_raw of the active client so helpers reach the socket
+with a single module-attribute lookup instead of going through
+get_client() on every call.
+"""
+_send = _not_connected
+_send_raw = _not_connected
+_send_noreply = _not_connected
+
+# Optional value codec (e.g. the snappy module) applied by helpers that
+# store serialized payloads; see set_codec().
+_codec = None
+
+def set_codec(codec):
+    """
+    Install a compression codec for stored values, or None to disable.
+
+    Any object with compress(bytes) -> bytes and decompress(bytes) ->
+    bytes works (e.g. python-snappy's module, or zlib). Compressed
+    values are framed with a one-byte b"\\x01" marker so legacy
+    uncompressed data passes through unchanged. Pair this with
+    decode_responses=False, since compressed payloads are not UTF-8.
+    """
+    global _codec
+    _codec = codec
+
 """
 Connect to the Go-Redis server.
 """
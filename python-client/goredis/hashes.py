@@ -1,61 +1,75 @@
-from .client import get_client
+from itertools import chain
 
-def HSet(key, field, value, *args):
+from . import client as _client
+from .client import _gen_encoder
+
+_enc_hget = _gen_encoder("HGET", 2)
+
+def HSet(key, field, value, *args, pipe=None):
     """
     Set the string value of a hash field.
     If the field already exists, it updates the value.
     """
-    return get_client().send_command("HSET", key, field, value, *args)
+    if pipe is not None:
+        return pipe.queue_command("HSET", key, field, value, *args)
+    return _client._send("HSET", key, field, value, *args)
 
 def HGet(key, field):
     """Get the value of a hash field."""
-    return get_client().send_command("HGET", key, field)
+    return _client._send_raw(_enc_hget(key, field))
 
 def HDel(key, *fields):
     """Delete one or more hash fields."""
-    return get_client().send_command("HDEL", key, *fields)
+    return _client._send("HDEL", key, *fields)
 
-def HGetAll(key):
+def HGetAll(key, lazy=False):
     """Get all fields and values in a hash."""
-    return get_client().send_command("HGETALL", key)
+    return _client._send("HGETALL", key, lazy=lazy)
 
 def HIncrBy(key, field, increment):
     """Increment the integer value of a hash field by the given amount."""
-    return get_client().send_command("HINCRBY", key, field, increment)
+    return _client._send("HINCRBY", key, field, increment)
 
 def HExists(key, field):
     """Check if a hash field exists."""
-    return get_client().send_command("HEXISTS", key, field)
+    return _client._send("HEXISTS", key, field)
 
 def HLen(key):
     """Get the number of fields in a hash."""
-    return get_client().send_command("HLEN", key)
+    return _client._send("HLEN", key)
 
 def HKeys(key):
     """Get all field names in a hash."""
-    return get_client().send_command("HKEYS", key)
+    return _client._send("HKEYS", key)
 
 def HVals(key):
     """Get all values in a hash."""
-    return get_client().send_command("HVALS", key)
+    return _client._send("HVALS", key)
 
-def HMSet(key, **mapping):
+def HMSet(key, mapping=None, **kwargs):
     """
-    Set multiple hash fields to multiple values using keyword arguments.
+    Set multiple hash fields to multiple values.
+
+    Accepts a dict (or iterable of (field, value) pairs), keyword
+    arguments, or both. Passing a mapping keeps insertion order and
+    allows field names that are not valid identifiers (e.g. "user:42").
     """
-    args = [key]
-    for k, v in mapping.items():
-        args.extend([k, v])
-    return get_client().send_command("HMSET", *args)
+    if mapping is None:
+        pairs = kwargs.items()
+    else:
+        pairs = mapping.items() if hasattr(mapping, 'items') else mapping
+        if kwargs:
+            pairs = chain(pairs, kwargs.items())
+    return _client._send("HMSET", key, *chain.from_iterable(pairs))
 
 def HMGet(key, *fields):
     """Get the values of all the given hash fields."""
-    return get_client().send_command("HMGET", key, *fields)
+    return _client._send("HMGET", key, *fields)
 
 def HDelAll(key):
     """Delete all fields in a hash."""
-    return get_client().send_command("HDELALL", key)
+    return _client._send("HDELALL", key)
 
 def HExpire(key, field, seconds):
     """Set expiration for a hash field in seconds."""
-    return get_client().send_command("HEXPIRE", key, field, seconds)
\ No newline at end of file
+    return _client._send("HEXPIRE", key, field, seconds)
\ No newline at end of file
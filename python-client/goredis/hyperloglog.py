@@ -1,17 +1,17 @@
-from .client import get_client
+from . import client as _client
 
 def PfAdd(key, *elements):
     """Add one or more elements to a HyperLogLog stored at key."""
-    return get_client().send_command("PFADD", key, *elements)
+    return _client._send("PFADD", key, *elements)
 
 def PfCount(*keys):
     """Return the approximated cardinality of the HyperLogLog(s) at key(s)."""
-    return get_client().send_command("PFCOUNT", *keys)
+    return _client._send("PFCOUNT", *keys)
 
 def PfDebug(key):
     """Return internal debugging information about a HyperLogLog stored at key."""
-    return get_client().send_command("PFDEBUG", key)
+    return _client._send("PFDEBUG", key)
 
 def PfMerge(dest_key, *source_keys):
     """Merge multiple HyperLogLog values into a single destination HyperLogLog."""
-    return get_client().send_command("PFMERGE", dest_key, *source_keys)
+    return _client._send("PFMERGE", dest_key, *source_keys)
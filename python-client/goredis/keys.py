@@ -1,8 +1,13 @@
-from .client import get_client
+from . import client as _client
+from .client import _gen_encoder
+
+_enc_del1 = _gen_encoder("DEL", 1)
 
 def Del(*keys):
     """Delete one or more keys."""
-    return get_client().send_command("DEL", *keys)
+    if len(keys) == 1:
+        return _client._send_raw(_enc_del1(keys[0]))
+    return _client._send("DEL", *keys)
 
 def Delete(*keys):
     """Alias for Del."""
@@ -10,28 +15,28 @@ def Delete(*keys):
 
 def Exists(*keys):
     """Check if keys exist."""
-    return get_client().send_command("EXISTS", *keys)
+    return _client._send("EXISTS", *keys)
 
 def Keys(pattern):
     """Find all keys matching the given pattern."""
-    return get_client().send_command("KEYS", pattern)
+    return _client._send("KEYS", pattern)
 
 def Rename(key, newkey):
     """Rename a key."""
-    return get_client().send_command("RENAME", key, newkey)
+    return _client._send("RENAME", key, newkey)
 
 def Type(key):
     """Determine the type stored at key."""
-    return get_client().send_command("TYPE", key)
+    return _client._send("TYPE", key)
 
 def Expire(key, seconds):
     """Set a key's time to live in seconds."""
-    return get_client().send_command("EXPIRE", key, seconds)
+    return _client._send("EXPIRE", key, seconds)
 
 def Ttl(key):
     """Get the time to live for a key in seconds."""
-    return get_client().send_command("TTL", key)
+    return _client._send("TTL", key)
 
 def Persist(key):
     """Remove the expiration from a key."""
-    return get_client().send_command("PERSIST", key)
\ No newline at end of file
+    return _client._send("PERSIST", key)
\ No newline at end of file
@@ -1,33 +1,39 @@
-from .client import get_client
+from . import client as _client
 
-def LPush(key, *values):
+def LPush(key, *values, pipe=None):
     """Prepend one or multiple values to a list."""
-    return get_client().send_command("LPUSH", key, *values)
+    if pipe is not None:
+        return pipe.queue_command("LPUSH", key, *values)
+    return _client._send("LPUSH", key, *values)
 
-def RPush(key, *values):
+def RPush(key, *values, pipe=None):
     """Append one or multiple values to a list."""
-    return get_client().send_command("RPUSH", key, *values)
+    if pipe is not None:
+        return pipe.queue_command("RPUSH", key, *values)
+    return _client._send("RPUSH", key, *values)
 
 def LPop(key):
     """Remove and get the first element in a list."""
-    return get_client().send_command("LPOP", key)
+    return _client._send("LPOP", key)
 
 def RPop(key):
     """Remove and get the last element in a list."""
-    return get_client().send_command("RPOP", key)
+    return _client._send("RPOP", key)
 
-def LRange(key, start, stop):
+def LRange(key, start, stop, lazy=False):
     """Get a range of elements from a list."""
-    return get_client().send_command("LRANGE", key, start, stop)
+    return _client._send("LRANGE", key, start, stop, lazy=lazy)
 
 def LLen(key):
     """Get the length of a list."""
-    return get_client().send_command("LLEN", key)
+    return _client._send("LLEN", key)
 
 def LIndex(key, index):
     """Get an element from a list by its index."""
-    return get_client().send_command("LINDEX", key, index)
+    return _client._send("LINDEX", key, index)
 
-def LGet(key):
+def LGet(key, lazy=False, pipe=None):
     """Get all elements in a list."""
-    return get_client().send_command("LGET", key)
\ No newline at end of file
+    if pipe is not None:
+        return pipe.queue_command("LGET", key)
+    return _client._send("LGET", key, lazy=lazy)
\ No newline at end of file
@@ -1,8 +1,8 @@
-from .client import get_client
+from . import client as _client
 
 def Publish(channel, message):
     """Post a message to a channel."""
-    return get_client().send_command("PUBLISH", channel, message)
+    return _client._send("PUBLISH", channel, message)
 
 def Pub(channel, message):
     """Alias for Publish."""
@@ -10,7 +10,7 @@ def Pub(channel, message):
 
 def Subscribe(*channels):
     """Listen for messages published to the given channels."""
-    return get_client().send_command("SUBSCRIBE", *channels)
+    return _client._send("SUBSCRIBE", *channels)
 
 def Sub(*channels):
     """Alias for Subscribe."""
@@ -18,7 +18,7 @@ def Sub(*channels):
 
 def Unsubscribe(*channels):
     """Stop listening for messages posted to the given channels."""
-    return get_client().send_command("UNSUBSCRIBE", *channels)
+    return _client._send("UNSUBSCRIBE", *channels)
 
 def Unsub(*channels):
     """Alias for Unsubscribe."""
@@ -26,7 +26,7 @@ def Unsub(*channels):
 
 def PSubscribe(*patterns):
     """Listen for messages published to channels matching the given patterns."""
-    return get_client().send_command("PSUBSCRIBE", *patterns)
+    return _client._send("PSUBSCRIBE", *patterns)
 
 def PSub(*patterns):
     """Alias for PSubscribe."""
@@ -34,7 +34,7 @@ def PSub(*patterns):
 
 def PUnsubscribe(*patterns):
     """Stop listening for messages posted to channels matching the given patterns."""
-    return get_client().send_command("PUNSUBSCRIBE", *patterns)
+    return _client._send("PUNSUBSCRIBE", *patterns)
 
 def PUnsub(*patterns):
     """Alias for PUnsubscribe."""
@@ -1,10 +1,79 @@
-from .client import GoRedisClient, get_client
+from .client import GoRedisClient, MultiplexedClient, Pool, get_client, _fixed_frame
 from . import client as client_module
 
-def Connect(host='127.0.0.1', port=7379):
-    """Initializes the global connection to the go-redis server."""
-    c = GoRedisClient(host, port)
+# RESP frames for commands whose encoding is fully fixed, built once
+# at import so the hot helpers skip the per-call encode loop.
+_PING_FRAME = _fixed_frame("PING")
+_MONITOR_FRAME = _fixed_frame("MONITOR")
+_DBSIZE_FRAME = _fixed_frame("DBSIZE")
+_FLUSHDB_FRAME = _fixed_frame("FLUSHDB")
+_FLUSHALL_FRAME = _fixed_frame("FLUSHALL")
+_WHOAMI_FRAME = _fixed_frame("WHOAMI")
+_SAVE_FRAME = _fixed_frame("SAVE")
+_BGSAVE_FRAME = _fixed_frame("BGSAVE")
+_BGREWRITEAOF_FRAME = _fixed_frame("BGREWRITEAOF")
+_COMMAND_FRAME = _fixed_frame("COMMAND")
+_INFO_FRAME = _fixed_frame("INFO")
+_SIZE_FRAME = _fixed_frame("SIZE")
+_USERS_FRAME = _fixed_frame("USERS")
+_COMMANDS_FRAME = _fixed_frame("COMMANDS")
+
+def Connect(host='127.0.0.1', port=7379, multiplexed=False, decode_responses=True,
+            pool_size=None):
+    """
+    Initializes the global connection to the go-redis server.
+
+    With multiplexed=True the connection is shared safely between
+    threads, coalescing concurrent commands into pipelined writes.
+    With decode_responses=False string replies stay raw bytes.
+    With pool_size=N every command checks a connection out of a pool of
+    up to N, so blocking commands do not stall unrelated callers.
+
+    Calling Connect() again for the same plain-client endpoint reuses
+    the live connection instead of paying another TCP handshake.
+    """
+    existing = client_module._global_client
+    if (not multiplexed and not pool_size
+            and type(existing) is GoRedisClient
+            and (existing.host, existing.port) == (host, port)
+            and existing.decode_responses == decode_responses):
+        # Only reuse a connection that still answers: a cheap PING keeps
+        # Connect() the recovery path after a dropped connection instead
+        # of handing the dead client back.
+        try:
+            existing.send_raw(_PING_FRAME)
+            return "Connected"
+        except (EOFError, OSError):
+            try:
+                existing.close()
+            except OSError:
+                pass
+            client_module._global_client = None
+    if pool_size:
+        pool = Pool(host, port, pool_size, decode_responses=decode_responses)
+
+        def _pool_send(*args, **kwargs):
+            with pool.acquire() as c:
+                return c.send_command(*args, **kwargs)
+
+        def _pool_send_raw(frame):
+            with pool.acquire() as c:
+                return c.send_raw(frame)
+
+        client_module._global_client = pool
+        client_module._send = _pool_send
+        client_module._send_raw = _pool_send_raw
+        client_module._send_noreply = client_module._noreply_unsupported
+        return "Connected"
+    cls = MultiplexedClient if multiplexed else GoRedisClient
+    c = cls(host, port, decode_responses=decode_responses)
     client_module._global_client = c
+    client_module._send = c.send_command
+    client_module._send_raw = c.send_raw
+    # No-reply sends only make sense when one caller owns the connection
+    # and its reply stream; the multiplexed reader consumes every reply.
+    client_module._send_noreply = (client_module._noreply_unsupported
+                                   if multiplexed else c.send_noreply)
     return "Connected"
 
 def Close():
@@ -12,22 +81,25 @@ def Close():
     c = get_client()
     c.close()
     client_module._global_client = None
+    client_module._send = client_module._not_connected
+    client_module._send_raw = client_module._not_connected
+    client_module._send_noreply = client_module._not_connected
 
 def Auth(username, password=None):
     """Authenticate user to the server."""
     if password is None:
-        return get_client().send_command("AUTH", username)
-    return get_client().send_command("AUTH", username, password)
+        return client_module._send("AUTH", username)
+    return client_module._send("AUTH", username, password)
 
 def Ping(message=None):
     """Ping the server."""
-    args = ["PING"]
-    if message: args.append(message)
-    return get_client().send_command(*args)
+    if message is None:
+        return client_module._send_raw(_PING_FRAME)
+    return client_module._send("PING", message)
 
 def Select(index):
     """Change the selected database for the current connection."""
-    return get_client().send_command("SELECT", index)
+    return client_module._send("SELECT", index)
 
 def Sel(index):
     """Alias for Select."""
@@ -35,25 +107,25 @@ def Sel(index):
 
 def Info(key=None):
     """Get server information and statistics or per-key metadata."""
-    args = ["INFO"]
-    if key: args.append(key)
-    return get_client().send_command(*args)
+    if key is None:
+        return client_module._send_raw(_INFO_FRAME)
+    return client_module._send("INFO", key)
 
 def Monitor():
     """Listen for all requests received by the server in real time."""
-    return get_client().send_command("MONITOR")
+    return client_module._send_raw(_MONITOR_FRAME)
 
 def DbSize():
     """Return the number of keys in the database."""
-    return get_client().send_command("DBSIZE")
+    return client_module._send_raw(_DBSIZE_FRAME)
 
 def FlushDb():
     """Remove all keys from the database."""
-    return get_client().send_command("FLUSHDB")
+    return client_module._send_raw(_FLUSHDB_FRAME)
 
 def FlushAll():
     """Remove all keys from all databases."""
-    return get_client().send_command("FLUSHALL")
+    return client_module._send_raw(_FLUSHALL_FRAME)
 
 def DropDb():
     """Alias for FlushDb."""
@@ -61,50 +133,50 @@ def DropDb():
 
 def Size(db_index=None):
     """Get the number of databases or size of a specific database."""
-    args = ["SIZE"]
-    if db_index is not None: args.append(db_index)
-    return get_client().send_command(*args)
+    if db_index is None:
+        return client_module._send_raw(_SIZE_FRAME)
+    return client_module._send("SIZE", db_index)
 
 def UserAdd(admin_flag, user, password):
     """Create a new user (Admin only)."""
-    return get_client().send_command("USERADD", admin_flag, user, password)
+    return client_module._send("USERADD", admin_flag, user, password)
 
 def UserDel(user):
     """Delete the specified user (Admin only)."""
-    return get_client().send_command("USERDEL", user)
+    return client_module._send("USERDEL", user)
 
 def Passwd(user, password):
     """Change a user's password."""
-    return get_client().send_command("PASSWD", user, password)
+    return client_module._send("PASSWD", user, password)
 
 def Users(username=None):
     """List all usernames or show specific user details."""
-    args = ["USERS"]
-    if username: args.append(username)
-    return get_client().send_command(*args)
+    if username is None:
+        return client_module._send_raw(_USERS_FRAME)
+    return client_module._send("USERS", username)
 
 def WhoAmI():
     """Display details of the currently authenticated user."""
-    return get_client().send_command("WHOAMI")
+    return client_module._send_raw(_WHOAMI_FRAME)
 
 def Save():
     """Synchronously save the database to disk."""
-    return get_client().send_command("SAVE")
+    return client_module._send_raw(_SAVE_FRAME)
 
 def BgSave():
     """Asynchronously save the database to disk."""
-    return get_client().send_command("BGSAVE")
+    return client_module._send_raw(_BGSAVE_FRAME)
 
 def BgRewriteAof():
     """Asynchronously rewrite the Append-Only File."""
-    return get_client().send_command("BGREWRITEAOF")
+    return client_module._send_raw(_BGREWRITEAOF_FRAME)
 
 def Command():
     """Get help about Redis commands."""
-    return get_client().send_command("COMMAND")
+    return client_module._send_raw(_COMMAND_FRAME)
 
 def Commands(pattern=None):
     """List available commands or get help for a specific command."""
-    args = ["COMMANDS"]
-    if pattern: args.append(pattern)
-    return get_client().send_command(*args)
\ No newline at end of file
+    if pattern is None:
+        return client_module._send_raw(_COMMANDS_FRAME)
+    return client_module._send("COMMANDS", pattern)
\ No newline at end of file
@@ -1,39 +1,39 @@
-from .client import get_client
+from . import client as _client
 
 def SAdd(key, *members):
     """Add one or more members to a set."""
-    return get_client().send_command("SADD", key, *members)
+    return _client._send("SADD", key, *members)
 
 def SRem(key, *members):
     """Remove one or more members from a set."""
-    return get_client().send_command("SREM", key, *members)
+    return _client._send("SREM", key, *members)
 
-def SMembers(key):
+def SMembers(key, lazy=False):
     """Get all the members in a set."""
-    return get_client().send_command("SMEMBERS", key)
+    return _client._send("SMEMBERS", key, lazy=lazy)
 
 def SIsMember(key, member):
     """Determine if a given value is a member of a set."""
-    return get_client().send_command("SISMEMBER", key, member)
+    return _client._send("SISMEMBER", key, member)
 
 def SCard(key):
     """Get the number of members in a set."""
-    return get_client().send_command("SCARD", key)
+    return _client._send("SCARD", key)
 
 def SDiff(*keys):
     """Subtract multiple sets."""
-    return get_client().send_command("SDIFF", *keys)
+    return _client._send("SDIFF", *keys)
 
 def SInter(*keys):
     """Intersect multiple sets."""
-    return get_client().send_command("SINTER", *keys)
+    return _client._send("SINTER", *keys)
 
 def SUnion(*keys):
     """Add multiple sets."""
-    return get_client().send_command("SUNION", *keys)
+    return _client._send("SUNION", *keys)
 
 def SRandMember(key, count=None):
     """Get one or multiple random members from a set."""
     args = ["SRANDMEMBER", key]
     if count is not None: args.append(count)
-    return get_client().send_command(*args)
\ No newline at end of file
+    return _client._send(*args)
\ No newline at end of file
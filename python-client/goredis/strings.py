@@ -1,40 +1,63 @@
-from .client import get_client
+from itertools import chain
 
-def Get(key):
+from . import client as _client
+from .client import _gen_encoder
+
+# Specialized encoders for the hottest fixed-arity commands, generated
+# once at import so each call builds its frame without the generic loop.
+_enc_get = _gen_encoder("GET", 1)
+_enc_set = _gen_encoder("SET", 2)
+_enc_incr = _gen_encoder("INCR", 1)
+_enc_decr = _gen_encoder("DECR", 1)
+
+def Get(key, pipe=None):
     """Retrieve the string value of a key."""
-    return get_client().send_command("GET", key)
+    if pipe is not None:
+        return pipe.queue_command("GET", key)
+    return _client._send_raw(_enc_get(key))
 
-def Set(key, value):
+def Set(key, value, pipe=None):
     """Set the string value of a key."""
-    return get_client().send_command("SET", key, value)
+    if pipe is not None:
+        return pipe.queue_command("SET", key, value)
+    return _client._send_raw(_enc_set(key, value))
 
 def Incr(key):
     """Increment the integer value of a key by one."""
-    return get_client().send_command("INCR", key)
+    return _client._send_raw(_enc_incr(key))
 
 def Decr(key):
     """Decrement the integer value of a key by one."""
-    return get_client().send_command("DECR", key)
+    return _client._send_raw(_enc_decr(key))
 
 def IncrBy(key, increment):
     """Increment the integer value of a key by the given amount."""
-    return get_client().send_command("INCRBY", key, increment)
+    return _client._send("INCRBY", key, increment)
 
 def DecrBy(key, decrement):
     """Decrement the integer value of a key by the given amount."""
-    return get_client().send_command("DECRBY", key, decrement)
+    return _client._send("DECRBY", key, decrement)
 
 def MGet(*keys):
     """Get the values of all the given keys."""
-    return get_client().send_command("MGET", *keys)
-
-def MSet(**mapping):
-    """Set multiple keys to multiple values using a dictionary or keyword arguments."""
-    args = []
-    for k, v in mapping.items():
-        args.extend([k, v])
-    return get_client().send_command("MSET", *args)
+    return _client._send("MGET", *keys)
+
+def MSet(mapping=None, **kwargs):
+    """
+    Set multiple keys to multiple values.
+
+    Accepts a dict (or iterable of (key, value) pairs), keyword
+    arguments, or both. Passing a mapping keeps insertion order and
+    allows key names that are not valid identifiers (e.g. "user:42").
+    """
+    if mapping is None:
+        pairs = kwargs.items()
+    else:
+        pairs = mapping.items() if hasattr(mapping, 'items') else mapping
+        if kwargs:
+            pairs = chain(pairs, kwargs.items())
+    return _client._send("MSET", *chain.from_iterable(pairs))
 
 def StrLen(key):
     """Get the length of the string value stored at key."""
-    return get_client().send_command("STRLEN", key)
\ No newline at end of file
+    return _client._send("STRLEN", key)
\ No newline at end of file
@@ -1,21 +1,55 @@
-from .client import get_client
+from . import client as _client
+from .client import Pipeline, _fixed_frame
+
+_MULTI_FRAME = _fixed_frame("MULTI")
+_EXEC_FRAME = _fixed_frame("EXEC")
+_DISCARD_FRAME = _fixed_frame("DISCARD")
+_UNWATCH_FRAME = _fixed_frame("UNWATCH")
+
+class Transaction(Pipeline):
+    """
+    Buffers WATCH + MULTI + queued commands + EXEC into a single write.
+
+    Where calling Watch/Multi/.../Exec separately pays a round-trip per
+    command, the whole transaction here crosses the network once:
+
+        with Transaction("my_key") as txn:
+            Set("my_key", "new_value", pipe=txn)
+        print(txn.results)
+
+    txn.results holds the EXEC reply after the block exits.
+    """
+    def __init__(self, *watches, client=None):
+        super().__init__(client)
+        self.results = None
+        if watches:
+            self.queue_command("WATCH", *watches)
+        self.buffer += _MULTI_FRAME
+        self.pending += 1
+
+    def execute(self):
+        """Send the whole transaction in one write and return the EXEC reply."""
+        self.buffer += _EXEC_FRAME
+        self.pending += 1
+        self.results = super().execute()[-1]
+        return self.results
 
 def Multi():
     """Mark the start of a transaction block."""
-    return get_client().send_command("MULTI")
+    return _client._send_raw(_MULTI_FRAME)
 
 def Exec():
     """Execute all commands queued in a transaction."""
-    return get_client().send_command("EXEC")
+    return _client._send_raw(_EXEC_FRAME)
 
 def Discard():
     """Discard all commands issued after MULTI."""
-    return get_client().send_command("DISCARD")
+    return _client._send_raw(_DISCARD_FRAME)
 
 def Watch(*keys):
     """Watch the given keys to determine execution of the MULTI/EXEC block."""
-    return get_client().send_command("WATCH", *keys)
+    return _client._send("WATCH", *keys)
 
 def Unwatch():
     """Forget about all watched keys."""
-    return get_client().send_command("UNWATCH")
\ No newline at end of file
+    return _client._send_raw(_UNWATCH_FRAME)
\ No newline at end of file
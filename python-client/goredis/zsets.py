@@ -1,35 +1,158 @@
-from .client import get_client
+from array import array
+from itertools import chain
 
-def ZAdd(key, *args):
-    """Add one or more members to a sorted set, or update its score. args: score, member, ..."""
-    return get_client().send_command("ZADD", key, *args)
+try:
+    import numpy
+except ImportError:  # typed score arrays fall back to array.array
+    numpy = None
 
-def ZRem(key, *members):
-    """Remove one or more members from a sorted set."""
-    return get_client().send_command("ZREM", key, *members)
+from . import client as _client
+from .client import Pipeline as ZPipeline, _gen_encoder
 
-def ZScore(key, member):
+# Specialized encoders for the fixed-arity hot ops; the variadic
+# ZADD/ZREM paths already hit the pre-encoded command-name cache.
+_enc_zscore = _gen_encoder("ZSCORE", 2)
+_enc_zcard = _gen_encoder("ZCARD", 1)
+
+def _compress_value(value):
+    # Compress one member value behind a one-byte marker so uncompressed
+    # legacy data stays distinguishable on the way back out. Non-string
+    # values (scores, ints) pass through untouched.
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    elif not isinstance(value, (bytes, bytearray)):
+        return value
+    return b"\x01" + _client._codec.compress(bytes(value))
+
+def _compress_members(args):
+    # With a codec installed, compress the member values (odd positions
+    # of score, member, ...).
+    out = list(args)
+    out[1::2] = [_compress_value(v) for v in out[1::2]]
+    return out
+
+def _decompress(value):
+    codec = _client._codec
+    if (codec is not None and isinstance(value, bytes)
+            and value[:1] == b"\x01"):
+        return codec.decompress(value[1:])
+    return value
+
+def ZAdd(key, *args, pipe=None, reply=True):
+    """
+    Add one or more members to a sorted set, or update its score. args: score, member, ...
+
+    With reply=False the command is fired without reading the server's
+    reply; call Sync() before issuing any normal command to drain the
+    deferred replies.
+    """
+    if _client._codec is not None:
+        args = _compress_members(args)
+    if pipe is not None:
+        return pipe.queue_command("ZADD", key, *args)
+    if not reply:
+        return _client._send_noreply("ZADD", key, *args)
+    return _client._send("ZADD", key, *args)
+
+def ZAddMany(key, pairs, pipe=None):
+    """
+    Add many (score, member) pairs with a single multi-score ZADD.
+
+    One command on the wire regardless of how many pairs are given --
+    the batch counterpart to calling ZAdd in a loop.
+    """
+    if pipe is not None:
+        return pipe.queue_command("ZADD", key, *chain.from_iterable(pairs))
+    return _client._send("ZADD", key, *chain.from_iterable(pairs))
+
+def ZRem(key, *members, pipe=None, reply=True):
+    """Remove one or more members from a sorted set. reply=False defers the reply to Sync()."""
+    if _client._codec is not None:
+        members = [_compress_value(m) for m in members]
+    if pipe is not None:
+        return pipe.queue_command("ZREM", key, *members)
+    if not reply:
+        return _client._send_noreply("ZREM", key, *members)
+    return _client._send("ZREM", key, *members)
+
+def Sync():
+    """Drain and return the replies deferred by reply=False calls, in order."""
+    client = _client.get_client()
+    if not hasattr(client, 'drain_replies'):
+        _client._noreply_unsupported()
+    return client.drain_replies()
+
+def ZScore(key, member, pipe=None):
     """Get the score associated with the given member in a sorted set."""
-    return get_client().send_command("ZSCORE", key, member)
+    if _client._codec is not None:
+        member = _compress_value(member)
+    if pipe is not None:
+        return pipe.queue_command("ZSCORE", key, member)
+    return _client._send_raw(_enc_zscore(key, member))
 
 def ZCard(key):
     """Get the number of members in a sorted set."""
-    return get_client().send_command("ZCARD", key)
+    return _client._send_raw(_enc_zcard(key))
+
+def _pair_scores(reply):
+    # Fold the flat WITHSCORES reply [m1, s1, m2, s2, ...] into
+    # [(m1, float(s1)), ...] using slicing/zip/map only -- no
+    # Python-level loop over the elements.
+    members = reply[0::2]
+    if _client._codec is not None:
+        members = [_decompress(m) for m in members]
+    return list(zip(members, map(float, reply[1::2])))
+
+def _typed_scores(reply, dtype):
+    # Split the flat WITHSCORES reply into (members, scores) where the
+    # scores land in a typed buffer instead of a list of float objects
+    # (28 bytes + a pointer each): numpy when available, array.array
+    # of doubles otherwise.
+    members = reply[0::2]
+    if _client._codec is not None:
+        members = [_decompress(m) for m in members]
+    scores = map(float, reply[1::2])
+    if numpy is not None:
+        return members, numpy.fromiter(scores, dtype=dtype, count=len(members))
+    return members, array('d', scores)
+
+def ZRange(key, start, stop, with_scores=False, scores_dtype=None):
+    """
+    Return a range of members in a sorted set, by index.
 
-def ZRange(key, start, stop, with_scores=False):
-    """Return a range of members in a sorted set, by index."""
-    args = ["ZRANGE", key, start, stop]
-    if with_scores: args.append("WITHSCORES")
-    return get_client().send_command(*args)
+    With with_scores=True the flat member/score reply is folded into a
+    list of (member, float(score)) pairs. Passing scores_dtype (e.g.
+    "f8") instead returns (members, scores) with the scores in a typed
+    array, avoiding per-float object overhead on large ranges.
+    """
+    if scores_dtype is not None:
+        reply = _client._send("ZRANGE", key, start, stop, "WITHSCORES")
+        return _typed_scores(reply, scores_dtype)
+    if with_scores:
+        return _pair_scores(_client._send("ZRANGE", key, start, stop,
+                                          "WITHSCORES"))
+    reply = _client._send("ZRANGE", key, start, stop)
+    if _client._codec is not None:
+        return [_decompress(v) for v in reply]
+    return reply
 
 def ZRevRange(key, start, stop, with_scores=False):
     """Return a range of members in a sorted set, by index, with scores ordered high to low."""
-    args = ["ZREVRANGE", key, start, stop]
-    if with_scores: args.append("WITHSCORES")
-    return get_client().send_command(*args)
+    if with_scores:
+        return _pair_scores(_client._send("ZREVRANGE", key, start, stop,
+                                          "WITHSCORES"))
+    reply = _client._send("ZREVRANGE", key, start, stop)
+    if _client._codec is not None:
+        return [_decompress(v) for v in reply]
+    return reply
 
 def ZGet(key, member=None):
     """Get score of a member or all members with scores."""
-    args = ["ZGET", key]
-    if member: args.append(member)
-    return get_client().send_command(*args)
\ No newline at end of file
+    if member:
+        if _client._codec is not None:
+            member = _compress_value(member)
+        return _client._send("ZGET", key, member)
+    reply = _client._send("ZGET", key)
+    if _client._codec is not None and isinstance(reply, list):
+        return [_decompress(v) for v in reply]
+    return reply
\ No newline at end of file
@@ -1,7 +1,7 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name='goredis',
     version='1.0.0',
-    packages=find_packages(),
+    packages=['goredis'],
 )
\ No newline at end of file
@@ -12,13 +12,19 @@ grs.Set("my_key", "Hello from Python!")
 print(grs.Get('my_key'))
 print(grs.Del('my_key'))
 print(grs.Get('my_key'))
-# List operations
-grs.LPush("my_list", "item1", "item2")
-print(f"List: {grs.LGet('my_list')}")
 
-# Transaction example
-grs.Watch("my_key")
-grs.Multi()
-grs.Set("my_key", "new_value")
-results = grs.Exec()
-print(f"Transaction Results: {results}")
+# Several independent SETs fuse into a single MSET command
+grs.MSet({"key:1": "one", "key:2": "two", "key:3": "three"})
+print(grs.MGet("key:1", "key:2", "key:3"))
+
+# List operations, batched into one round-trip with a pipeline
+pipe = grs.Pipeline()
+grs.LPush("my_list", "item1", "item2", pipe=pipe)
+grs.LGet("my_list", pipe=pipe)
+_, items = pipe.execute()
+print(f"List: {items}")
+
+# Transaction example: WATCH + MULTI + SET + EXEC go out as one write
+with grs.Transaction("my_key") as txn:
+    grs.Set("my_key", "new_value", pipe=txn)
+print(f"Transaction Results: {txn.results}")
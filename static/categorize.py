@@ -1,27 +1,77 @@
 import json
-from collections import defaultdict
+import sys
+from collections import Counter
+from operator import itemgetter
+
+try:
+    import json_stream
+except ImportError:  # streaming parser is optional; fall back to json.load
+    json_stream = None
+
+try:
+    import orjson
+except ImportError:  # C encoder is optional; fall back to stdlib json
+    orjson = None
+
+def _dumps(obj, pretty=False):
+    # Serialize to bytes, with orjson when available (its C encoder is
+    # several times faster than stdlib on nested dicts).
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=4).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def _iter_records(f):
+    # Yield (command, details) pairs one at a time. With json-stream
+    # installed, only the record currently being read is held in memory;
+    # otherwise json.load materializes the whole document first.
+    if json_stream is not None:
+        for command, details in json_stream.load(f).items():
+            yield command, json_stream.to_standard_types(details)
+    else:
+        yield from json.load(f).items()
+
+def split_json_by_category(input_file, pretty=False):
+    # Single pass: write each record to its category file as it is read,
+    # opening handles on demand. Nothing is grouped in memory -- only the
+    # open handles and a per-category count survive the loop. Each file
+    # is framed as a JSON object by hand ("{", "," between records, "}").
+    # Compact separators by default: the files are machine-consumed, and
+    # indent=4 costs an extra encoder pass and ~3x the bytes on disk.
+    handles = {}
+    counts = Counter()
+    handles_get = handles.get  # hoisted out of the per-record loop
+    get_cat = itemgetter("category")  # C-level lookup, no .get dispatch
 
-def split_json_by_category(input_file):
-    # 1. Load the original JSON data
     with open(input_file, 'r') as f:
-        data = json.load(f)
-
-    # 2. Group records by their 'category'
-    categorized_data = defaultdict(dict)
-    
-    for command, details in data.items():
-        category = details.get("category", "uncategorized")
-        # Add the command and its details to the respective category dictionary
-        categorized_data[category][command] = details
-
-    # 3. Write each category to its own JSON file
-    for category, records in categorized_data.items():
-        filename = f"{category}.json"
-        with open(filename, 'w') as out_file:
-            json.dump(records, out_file, indent=4)
-        print(f"Created: {filename} with {len(records)} records.")
+        for command, details in _iter_records(f):
+            try:
+                category = get_cat(details)
+            except KeyError:
+                category = "uncategorized"
+            out_file = handles_get(category)
+            if out_file is None:
+                # 64 KiB buffers: many small per-record writes coalesce
+                # into few write syscalls per category file.
+                out_file = handles[category] = open(f"{category}.json", 'wb',
+                                                    buffering=1 << 16)
+                out_file.write(b"{")
+            else:
+                out_file.write(b",")
+            out_file.write(_dumps(command) + b":" + _dumps(details, pretty))
+            counts[category] += 1
+
+    # One stdout write for the whole report instead of a print (and a
+    # write syscall) per category.
+    log_lines = []
+    for category, out_file in handles.items():
+        out_file.write(b"}")
+        out_file.close()
+        log_lines.append(f"Created: {category}.json with {counts[category]} records.\n")
+    sys.stdout.write("".join(log_lines))
 
 # Usage:
 # Save your input data to 'commands.json' and run:
 # split_json_by_category('commands.json')
-split_json_by_category('commands.json')
\ No newline at end of file
+split_json_by_category('commands.json')